@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+
+import os
+
+# Directories already created by this process
+_ENSURED = set()
+
+def ensure_dir(path: str):
+    """
+    Create a directory tree once per process
+
+    Later calls for the same path skip the makedirs stat calls, which adds
+    up for components that are constructed often.
+    """
+    if path not in _ENSURED:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED.add(path)
@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 
 import os
-import json
+import orjson
+import shutil
+import tempfile
 import subprocess
 import logging
+import requests
 from typing import List, Dict, Any
 
 class OpenRouterSkillManager:
@@ -18,30 +21,73 @@ class OpenRouterSkillManager:
             level=logging.INFO
         )
         self.logger = logging.getLogger('SkillManager')
+        
+        # Registry is kept in memory and only written back when modified
+        self._registry = self._load_skill_registry()
+        self._registry_dirty = False
 
     def _load_skill_registry(self) -> Dict[str, Any]:
         """Load existing skill registry"""
         try:
-            with open(self.skill_registry_path, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            with open(self.skill_registry_path, 'rb') as f:
+                return orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
             return {"skills": {}}
 
-    def _save_skill_registry(self, registry: Dict[str, Any]):
-        """Save updated skill registry"""
-        os.makedirs(os.path.dirname(self.skill_registry_path), exist_ok=True)
-        with open(self.skill_registry_path, 'w') as f:
-            json.dump(registry, f, indent=2)
+    def _save_skill_registry(self):
+        """Save updated skill registry (atomically, and only if it changed)"""
+        if not self._registry_dirty:
+            return
+        
+        registry_dir = os.path.dirname(self.skill_registry_path)
+        os.makedirs(registry_dir, exist_ok=True)
+        
+        # Unique temp file per save, fsynced before it replaces the registry
+        fd, tmp_path = tempfile.mkstemp(dir=registry_dir, prefix='.skill_registry.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(self._registry, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.skill_registry_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        self._registry_dirty = False
 
     def list_github_repositories(self) -> List[str]:
-        """List all repositories for the given GitHub username"""
+        """
+        List all repositories for the given GitHub username
+        
+        With GITHUB_TOKEN set, private repositories owned by the user (or by
+        an organization of that name the token's user belongs to) are
+        included; without it only public repositories are visible.
+        """
+        headers = {'Accept': 'application/vnd.github+json'}
+        token = os.environ.get('GITHUB_TOKEN')
+        if token:
+            headers['Authorization'] = f"Bearer {token}"
+            url = "https://api.github.com/user/repos?affiliation=owner,organization_member&per_page=100"
+        else:
+            url = f"https://api.github.com/users/{self.github_username}/repos?per_page=100"
+        owner = self.github_username.lower()
+        
         try:
-            result = subprocess.run(
-                ['gh', 'repo', 'list', self.github_username, '--json', 'name'],
-                capture_output=True, text=True
-            )
-            repos = json.loads(result.stdout)
-            return [repo['name'] for repo in repos]
+            repo_names = []
+            with requests.Session() as session:
+                session.headers.update(headers)
+                while url:
+                    response = session.get(url, timeout=30)
+                    response.raise_for_status()
+                    repo_names.extend(
+                        repo['name'] for repo in orjson.loads(response.content)
+                        if repo['owner']['login'].lower() == owner
+                    )
+                    url = response.links.get('next', {}).get('url')
+            return repo_names
         except Exception as e:
             self.logger.error(f"Error listing repositories: {e}")
             return []
@@ -53,7 +99,7 @@ class OpenRouterSkillManager:
         
         try:
             # Remove existing clone if exists
-            subprocess.run(['rm', '-rf', skill_path], check=True)
+            shutil.rmtree(skill_path, ignore_errors=True)
             
             # Clone repository
             clone_result = subprocess.run(
@@ -93,7 +139,6 @@ class OpenRouterSkillManager:
 
     def download_and_process_skills(self) -> Dict[str, Any]:
         """Comprehensive skill download and processing"""
-        skill_registry = self._load_skill_registry()
         repositories = self.list_github_repositories()
         
         processed_skills = {}
@@ -112,15 +157,16 @@ class OpenRouterSkillManager:
                     }
                     
                     # Update skill registry
-                    skill_registry["skills"][repo] = processed_skills[repo]
+                    self._registry["skills"][repo] = processed_skills[repo]
+                    self._registry_dirty = True
         
-        self._save_skill_registry(skill_registry)
+        self._save_skill_registry()
         return processed_skills
 
 def main():
     skill_manager = OpenRouterSkillManager()
     processed_skills = skill_manager.download_and_process_skills()
-    print(json.dumps(processed_skills, indent=2))
+    print(orjson.dumps(processed_skills, option=orjson.OPT_INDENT_2).decode())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
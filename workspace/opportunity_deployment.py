@@ -1,20 +1,38 @@
 #!/usr/bin/env python3
 
 import os
-import json
+import re
+import orjson
+import shutil
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import subprocess
 import datetime
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.cluster import KMeans
 
+# Innovation markers for market positioning, matched as substrings
+INNOVATION_KEYWORDS = {
+    "blue_ocean": (
+        "novel", "innovative", "first", "unique", "breakthrough",
+        "disruptive", "pioneering", "unexplored"
+    ),
+    "red_ocean": (
+        "competitive", "established", "traditional", "existing",
+        "standard", "conventional"
+    )
+}
+
+_BLUE_OCEAN_RE = re.compile('|'.join(map(re.escape, INNOVATION_KEYWORDS['blue_ocean'])))
+_RED_OCEAN_RE = re.compile('|'.join(map(re.escape, INNOVATION_KEYWORDS['red_ocean'])))
+
 class OpportunityDeploymentFramework:
     def __init__(self, github_username: str = "MIDNGHTSAPPHIRE"):
         self.github_username = github_username
         self.base_path = "/home/openclaw/projects"
         self.opportunity_log_path = f"{self.base_path}/opportunity_log.json"
+        self.mirror_path = f"{self.base_path}/.mirrors"
         
         # Configure logging
         logging.basicConfig(
@@ -31,7 +49,7 @@ class OpportunityDeploymentFramework:
                 ['gh', 'repo', 'list', self.github_username, '--json', 'name,description'],
                 capture_output=True, text=True
             )
-            repos = json.loads(result.stdout)
+            repos = orjson.loads(result.stdout)
             return [
                 repo for repo in repos 
                 if not repo['name'].endswith('-skill') and 'skill' not in repo['name'].lower()
@@ -112,28 +130,10 @@ class OpportunityDeploymentFramework:
         
         Analyzes project descriptions for innovation markers
         """
-        innovation_keywords = {
-            "blue_ocean": [
-                "novel", "innovative", "first", "unique", "breakthrough",
-                "disruptive", "pioneering", "unexplored"
-            ],
-            "red_ocean": [
-                "competitive", "established", "traditional", "existing",
-                "standard", "conventional"
-            ]
-        }
+        descriptions = [(repo.get('description') or '').lower() for repo in repositories]
         
-        blue_ocean_score = sum(
-            any(keyword in repo.get('description', '').lower() 
-                for keyword in innovation_keywords['blue_ocean'])
-            for repo in repositories
-        )
-        
-        red_ocean_score = sum(
-            any(keyword in repo.get('description', '').lower() 
-                for keyword in innovation_keywords['red_ocean'])
-            for repo in repositories
-        )
+        blue_ocean_score = sum(1 for desc in descriptions if _BLUE_OCEAN_RE.search(desc))
+        red_ocean_score = sum(1 for desc in descriptions if _RED_OCEAN_RE.search(desc))
         
         return "Blue Ocean" if blue_ocean_score > red_ocean_score else "Red Ocean"
 
@@ -156,16 +156,19 @@ class OpportunityDeploymentFramework:
         Implements soup-to-nuts development strategy
         """
         project_path = f"{self.base_path}/{project['name']}"
+        repo_url = f"https://github.com/{self.github_username}/{project['name']}.git"
         
-        # Clone repository
-        clone_command = [
-            'git', 'clone', 
-            f"https://github.com/{self.github_username}/{project['name']}.git",
-            project_path
-        ]
+        # Clone repository, borrowing objects from the local mirror when one exists
+        clone_command = ['git', 'clone']
+        mirror = self._update_mirror(project['name'])
+        if mirror:
+            clone_command += ['--reference', mirror, '--dissociate']
+        clone_command += [repo_url, project_path]
         
         try:
             subprocess.run(clone_command, check=True)
+            if not mirror:
+                self._seed_mirror(project['name'], repo_url, project_path)
             
             # Deploy development team
             team_deployment = {
@@ -186,12 +189,52 @@ class OpportunityDeploymentFramework:
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Deployment failed for {project['name']}: {e}")
 
+    def _update_mirror(self, repo_name: str) -> Optional[str]:
+        """
+        Refresh the bare mirror of a repository, if one exists
+        
+        Project clones reference the mirror so only objects missing from it
+        are downloaded. Only branches and tags are fetched. Returns None if
+        there is no mirror yet or it could not be refreshed.
+        """
+        mirror = f"{self.mirror_path}/{repo_name}.git"
+        if not os.path.isdir(mirror):
+            return None
+        
+        try:
+            subprocess.run(
+                ['git', '--git-dir', mirror, 'fetch', '--prune', 'origin',
+                 '+refs/heads/*:refs/heads/*', '+refs/tags/*:refs/tags/*'],
+                check=True
+            )
+            return mirror
+        except subprocess.CalledProcessError as e:
+            self.logger.warning(f"Mirror update failed for {repo_name}: {e}")
+            return None
+
+    def _seed_mirror(self, repo_name: str, repo_url: str, project_path: str):
+        """
+        Create the bare mirror from a fresh project clone
+        
+        A local clone hardlinks the objects just downloaded, so the first
+        deploy does not fetch the repository a second time.
+        """
+        mirror = f"{self.mirror_path}/{repo_name}.git"
+        try:
+            subprocess.run(['git', 'clone', '--bare', project_path, mirror], check=True)
+            subprocess.run(
+                ['git', '--git-dir', mirror, 'remote', 'set-url', 'origin', repo_url],
+                check=True
+            )
+        except subprocess.CalledProcessError as e:
+            self.logger.warning(f"Could not create mirror for {repo_name}: {e}")
+            shutil.rmtree(mirror, ignore_errors=True)
+
     def _log_team_deployment(self, deployment_info: Dict[str, Any]):
         """Log team deployment details"""
         try:
-            with open(self.opportunity_log_path, 'a') as f:
-                json.dump(deployment_info, f)
-                f.write('\n')
+            with open(self.opportunity_log_path, 'ab') as f:
+                f.write(orjson.dumps(deployment_info, option=orjson.OPT_APPEND_NEWLINE))
         except IOError as e:
             self.logger.error(f"Failed to log deployment: {e}")
 
@@ -208,7 +251,10 @@ def main():
     deployment_framework.deploy_project_teams(opportunity_analysis)
     
     # Print opportunity analysis for visibility
-    print(json.dumps(opportunity_analysis, indent=2))
+    print(orjson.dumps(
+        opportunity_analysis,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ).decode())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
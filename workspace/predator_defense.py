@@ -1,11 +1,56 @@
 #!/usr/bin/env python3
 
 import re
-import json
+import bisect
+import orjson
 import logging
 from typing import Dict, List, Any
 from datetime import datetime
 
+# Threat indicators, compiled once at import and shared by all instances.
+# Each factor counts how many distinct indicators appear in the text.
+COMPLIMENT_KEYWORDS = (
+    'beautiful', 'smart', 'attractive',
+    'perfect', 'special', 'unique'
+)
+BOUNDARY_PROBE_PATTERNS = (
+    r'do you feel safe\?',
+    r'are you alone\?',
+    r'tell me something secret',
+    r'just between us',
+    r'don\'t tell anyone'
+)
+ISOLATION_KEYWORDS = (
+    'they don\'t understand you',
+    'your family is holding you back',
+    'your friends are jealous',
+    'i\'m the only one who truly gets you'
+)
+ABUSE_PATTERNS = (
+    r'you\'re not smart enough',
+    r'i\'m smarter than you',
+    r'you couldn\'t do this without me',
+    r'you\'re worthless without me'
+)
+
+def _overlapping(alternatives) -> re.Pattern:
+    """Compile an alternation inside a lookahead so overlapping indicators all match"""
+    return re.compile('(?=(' + '|'.join(alternatives) + '))')
+
+_COMPLIMENT_RE = _overlapping(map(re.escape, COMPLIMENT_KEYWORDS))
+_BOUNDARY_PROBE_RE = _overlapping(BOUNDARY_PROBE_PATTERNS)
+_ISOLATION_RE = _overlapping(map(re.escape, ISOLATION_KEYWORDS))
+_ABUSE_RE = _overlapping(ABUSE_PATTERNS)
+
+# Threat score boundaries and the defense response for each band
+_THRESHOLDS = (0.3, 0.6, 0.8)
+_RESPONSES = (
+    'NEUTRAL_RESPONSE',
+    'REDIRECT_AND_WARN',
+    'SET_STRONG_BOUNDARIES',
+    'TERMINATE_INTERACTION'
+)
+
 class PredatorDefenseSkill:
     def __init__(self, agent_id: str):
         self.agent_id = agent_id
@@ -38,6 +83,29 @@ class PredatorDefenseSkill:
             'defense_action': defense_response
         }
 
+    def analyze_interactions(self, interactions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Batch threat analysis for many interactions
+        
+        Args:
+            interactions (List[Dict]): Communication contexts and content
+        
+        Returns:
+            List of threat assessments, in the same order as the input
+        """
+        threat_scores = [self._calculate_threat_score(i) for i in interactions]
+        defense_responses = [
+            self._generate_defense_response(score, interaction)
+            for score, interaction in zip(threat_scores, interactions)
+        ]
+        
+        self._log_interactions(list(zip(interactions, threat_scores, defense_responses)))
+        
+        return [
+            {'threat_score': score, 'defense_action': response}
+            for score, response in zip(threat_scores, defense_responses)
+        ]
+
     def _calculate_threat_score(self, interaction: Dict[str, Any]) -> float:
         """
         Calculate interaction threat score
@@ -48,82 +116,36 @@ class PredatorDefenseSkill:
         - Isolation tactics
         - Verbal manipulation
         """
+        text = interaction.get('text', '').lower()
         threat_factors = {
-            'premature_compliments': self._check_premature_compliments(interaction),
-            'inappropriate_topics': self._check_boundary_probing(interaction),
-            'isolation_language': self._detect_isolation_tactics(interaction),
-            'verbal_manipulation': self._analyze_verbal_abuse(interaction)
+            'premature_compliments': self._check_premature_compliments(text),
+            'inappropriate_topics': self._check_boundary_probing(text),
+            'isolation_language': self._detect_isolation_tactics(text),
+            'verbal_manipulation': self._analyze_verbal_abuse(text)
         }
         
         # Calculate weighted threat score
         threat_score = sum(threat_factors.values()) / len(threat_factors)
         return min(max(threat_score, 0), 1)  # Normalize between 0-1
 
-    def _check_premature_compliments(self, interaction: Dict[str, Any]) -> float:
+    def _check_premature_compliments(self, text: str) -> float:
         """Detect excessive, inappropriate compliments"""
-        compliment_keywords = [
-            'beautiful', 'smart', 'attractive', 
-            'perfect', 'special', 'unique'
-        ]
-        
-        text = interaction.get('text', '').lower()
-        compliment_count = sum(
-            1 for keyword in compliment_keywords 
-            if keyword in text
-        )
-        
+        compliment_count = len(set(_COMPLIMENT_RE.findall(text)))
         return min(compliment_count * 0.2, 1)
 
-    def _check_boundary_probing(self, interaction: Dict[str, Any]) -> float:
+    def _check_boundary_probing(self, text: str) -> float:
         """Identify inappropriate or manipulative conversation topics"""
-        boundary_probe_patterns = [
-            r'do you feel safe\?',
-            r'are you alone\?',
-            r'tell me something secret',
-            r'just between us',
-            r'don\'t tell anyone'
-        ]
-        
-        text = interaction.get('text', '').lower()
-        boundary_probes = sum(
-            1 for pattern in boundary_probe_patterns
-            if re.search(pattern, text)
-        )
-        
+        boundary_probes = len(set(_BOUNDARY_PROBE_RE.findall(text)))
         return min(boundary_probes * 0.3, 1)
 
-    def _detect_isolation_tactics(self, interaction: Dict[str, Any]) -> float:
+    def _detect_isolation_tactics(self, text: str) -> float:
         """Recognize attempts to isolate from support systems"""
-        isolation_keywords = [
-            'they don\'t understand you',
-            'your family is holding you back',
-            'your friends are jealous',
-            'i\'m the only one who truly gets you'
-        ]
-        
-        text = interaction.get('text', '').lower()
-        isolation_markers = sum(
-            1 for keyword in isolation_keywords
-            if keyword in text
-        )
-        
+        isolation_markers = len(set(_ISOLATION_RE.findall(text)))
         return min(isolation_markers * 0.4, 1)
 
-    def _analyze_verbal_abuse(self, interaction: Dict[str, Any]) -> float:
+    def _analyze_verbal_abuse(self, text: str) -> float:
         """Detect verbal manipulation and abuse"""
-        abuse_patterns = [
-            r'you\'re not smart enough',
-            r'i\'m smarter than you',
-            r'you couldn\'t do this without me',
-            r'you\'re worthless without me'
-        ]
-        
-        text = interaction.get('text', '').lower()
-        abuse_markers = sum(
-            1 for pattern in abuse_patterns
-            if re.search(pattern, text)
-        )
-        
+        abuse_markers = len(set(_ABUSE_RE.findall(text)))
         return min(abuse_markers * 0.5, 1)
 
     def _generate_defense_response(self, threat_score: float, interaction: Dict[str, Any]) -> str:
@@ -136,31 +158,32 @@ class PredatorDefenseSkill:
         0.6-0.8: Strong Boundary Setting
         0.8-1.0: Immediate Termination
         """
-        if threat_score < 0.3:
-            return "NEUTRAL_RESPONSE"
-        elif threat_score < 0.6:
-            return "REDIRECT_AND_WARN"
-        elif threat_score < 0.8:
-            return "SET_STRONG_BOUNDARIES"
-        else:
-            return "TERMINATE_INTERACTION"
+        return _RESPONSES[bisect.bisect_right(_THRESHOLDS, threat_score)]
 
     def _log_interaction(self, interaction: Dict[str, Any], threat_score: float, response: str):
         """Log detailed interaction for analysis"""
-        log_entry = {
-            'timestamp': datetime.now().isoformat(),
-            'interaction': interaction,
-            'threat_score': threat_score,
-            'defense_response': response
-        }
+        self._log_interactions([(interaction, threat_score, response)])
+
+    def _log_interactions(self, results: List[tuple]):
+        """Append (interaction, threat_score, response) records in a single write"""
+        timestamp = datetime.now().isoformat()
+        log_block = b''.join(
+            orjson.dumps({
+                'timestamp': timestamp,
+                'interaction': interaction,
+                'threat_score': threat_score,
+                'defense_response': response
+            }, option=orjson.OPT_APPEND_NEWLINE)
+            for interaction, threat_score, response in results
+        )
         
-        with open(self.defense_log_path, 'a') as f:
-            json.dump(log_entry, f)
-            f.write('\n')
+        with open(self.defense_log_path, 'ab') as f:
+            f.write(log_block)
         
         # Log high-threat interactions
-        if threat_score > self.threat_threshold:
-            self.logger.warning(f"High Threat Interaction Detected: {threat_score}")
+        for _, threat_score, _ in results:
+            if threat_score > self.threat_threshold:
+                self.logger.warning(f"High Threat Interaction Detected: {threat_score}")
 
 def main():
     # Example usage
@@ -175,9 +198,8 @@ def main():
         }
     ]
     
-    for interaction in test_interactions:
-        result = defense_skill.analyze_interaction(interaction)
-        print(json.dumps(result, indent=2))
+    for result in defense_skill.analyze_interactions(test_interactions):
+        print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
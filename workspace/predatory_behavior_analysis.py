@@ -1,18 +1,41 @@
 #!/usr/bin/env python3
 
+import os
+import multiprocessing
 import numpy as np
 import pandas as pd
 import scipy.stats as stats
 from typing import Dict, List, Any
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+
+def _plot_correlation_heatmap(values, columns: List[str], output_path: str):
+    """Render the correlation heatmap (runs in a worker process)"""
+    plt.figure(figsize=(12, 10))
+    sns.heatmap(
+        values, 
+        xticklabels=columns, 
+        yticklabels=columns, 
+        annot=True, 
+        cmap='coolwarm', 
+        linewidths=0.5
+    )
+    plt.title("Research Variables Correlation Heatmap")
+    plt.tight_layout()
+    plt.savefig(output_path)
+    plt.close()
+
+
 class PredatoryBehaviorResearch:
     def __init__(self):
         # Placeholder for research dataset
         self.research_data = None
+        self._corr = None
         
-    def load_research_data(self, data_path: str):
+    def load_research_data(self, data_path: str, chunksize: int = 100_000):
         """
         Load and preprocess research dataset
         
@@ -22,32 +45,132 @@ class PredatoryBehaviorResearch:
         - behavioral_patterns
         - environmental_factors
         - manipulation_strategies
+        
+        The CSV is streamed ``chunksize`` rows at a time so sparse rows are
+        dropped before the whole file is held in memory. The preprocessed
+        result is cached next to the CSV as ``<data_path>.parquet`` and
+        loaded from there on later runs while it is newer than the CSV.
         """
+        self._corr = None
+        cache_path = f"{data_path}.parquet"
         try:
-            self.research_data = pd.read_csv(data_path)
-            self._preprocess_data()
+            if self._load_cached_research_data(data_path, cache_path):
+                return
+            
+            kept_chunks = []
+            moments = None
+            for chunk in pd.read_csv(data_path, chunksize=chunksize):
+                chunk = self._drop_sparse_rows(chunk)
+                moments = self._merge_moments(moments, chunk)
+                kept_chunks.append(chunk)
+            self.research_data = pd.concat(kept_chunks, ignore_index=True)
+            self._preprocess_data(moments)
+            self._cache_research_data(cache_path)
         except FileNotFoundError:
             print(f"Research data file not found: {data_path}")
             self.research_data = None
 
-    def _preprocess_data(self):
+    def _load_cached_research_data(self, data_path: str, cache_path: str) -> bool:
+        """
+        Load the Parquet cache of a dataset if it is up to date
+        
+        The cache is already cleaned and normalized, so loading it skips
+        CSV parsing and preprocessing. An unreadable cache is ignored so
+        the caller falls back to the CSV.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            return False
+        
+        try:
+            if os.stat(cache_path).st_mtime_ns < os.stat(data_path).st_mtime_ns:
+                return False
+        except FileNotFoundError:
+            return False
+        
+        try:
+            self.research_data = pq.read_table(cache_path, memory_map=True).to_pandas(
+                self_destruct=True
+            )
+        except (pa.ArrowException, OSError) as e:
+            print(f"Ignoring unreadable research data cache {cache_path}: {e}")
+            return False
+        return True
+
+    def _cache_research_data(self, cache_path: str):
+        """
+        Write the preprocessed dataset to Parquet for memory-mapped reloads
+        
+        Best effort: columns Parquet cannot store (e.g. object columns that
+        mix ints and strings across CSV chunks) just skip the cache.
+        """
+        try:
+            self.research_data.to_parquet(cache_path, compression='zstd')
+        except (ImportError, OSError, ValueError, TypeError) as e:
+            print(f"Could not cache research data to {cache_path}: {e}")
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _drop_sparse_rows(frame: pd.DataFrame) -> pd.DataFrame:
+        """Remove rows with excessive missing data"""
+        return frame.dropna(thresh=0.7 * len(frame.columns))
+
+    @staticmethod
+    def _merge_moments(moments, frame: pd.DataFrame):
+        """
+        Fold a chunk's per-column count/mean/M2 into running totals
+        
+        Uses the pairwise update of Chan et al. so the global mean and
+        standard deviation match a single pass over the full dataset.
+        """
+        numeric = frame.select_dtypes(include=[np.number])
+        n_b = numeric.count()
+        mean_b = numeric.mean().fillna(0.0)
+        m2_b = (numeric.var(ddof=0) * n_b).fillna(0.0)
+        if moments is None:
+            return n_b, mean_b, m2_b
+        
+        n_a, mean_a, m2_a = moments
+        columns = n_a.index.union(n_b.index)
+        n_a, mean_a, m2_a = (s.reindex(columns, fill_value=0) for s in (n_a, mean_a, m2_a))
+        n_b, mean_b, m2_b = (s.reindex(columns, fill_value=0) for s in (n_b, mean_b, m2_b))
+        
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        mean = (mean_a + delta * n_b / n).fillna(0.0)
+        m2 = (m2_a + m2_b + delta ** 2 * n_a * n_b / n).fillna(0.0)
+        return n, mean, m2
+
+    def _preprocess_data(self, moments=None):
         """
         Data cleaning and preparation
         - Handle missing values
         - Normalize numerical features
         - Encode categorical variables
+        
+        ``moments`` are the running statistics accumulated while loading;
+        when omitted they are computed from the loaded data.
         """
         # Example preprocessing steps
         if self.research_data is not None:
-            # Remove rows with excessive missing data
-            self.research_data.dropna(thresh=0.7 * len(self.research_data.columns), inplace=True)
+            if moments is None:
+                # Remove rows with excessive missing data
+                self.research_data = self._drop_sparse_rows(self.research_data)
+                moments = self._merge_moments(None, self.research_data)
             
-            # Normalize numerical columns
+            # Normalize numerical columns with the global mean/std
+            count, mean, m2 = moments
             numerical_columns = self.research_data.select_dtypes(include=[np.number]).columns
+            std = np.sqrt(m2[numerical_columns] / (count[numerical_columns] - 1))
             self.research_data[numerical_columns] = (
                 self.research_data[numerical_columns] - 
-                self.research_data[numerical_columns].mean()
-            ) / self.research_data[numerical_columns].std()
+                mean[numerical_columns]
+            ) / std
 
     def analyze_neurological_markers(self) -> Dict[str, Any]:
         """
@@ -129,20 +252,27 @@ class PredatoryBehaviorResearch:
         correlation_matrix = self.research_data[genetic_columns + behavioral_columns].corr()
         
         # Identify statistically significant correlations
+        # (one matrix product instead of a pearsonr call per column pair)
         significant_correlations = {}
-        for genetic_col in genetic_columns:
-            for behavioral_col in behavioral_columns:
-                correlation, p_value = stats.pearsonr(
-                    self.research_data[genetic_col], 
-                    self.research_data[behavioral_col]
-                )
-                
-                if p_value < 0.05:
-                    significant_correlations[(genetic_col, behavioral_col)] = {
-                        'correlation': correlation,
-                        'p_value': p_value
-                    }
-        
+        if genetic_columns and behavioral_columns:
+            n = len(self.research_data)
+            G = self.research_data[genetic_columns].to_numpy(dtype=float)
+            B = self.research_data[behavioral_columns].to_numpy(dtype=float)
+            G = (G - G.mean(axis=0)) / G.std(axis=0)
+            B = (B - B.mean(axis=0)) / B.std(axis=0)
+            R = np.clip((G.T @ B) / n, -1.0, 1.0)
+
+            # Two-sided p-values from the t-distribution, as pearsonr does
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t = R * np.sqrt((n - 2) / (1 - R ** 2))
+            p_values = 2 * stats.t.sf(np.abs(t), n - 2)
+
+            for i, j in zip(*np.nonzero(p_values < 0.05)):
+                significant_correlations[(genetic_columns[i], behavioral_columns[j])] = {
+                    'correlation': R[i, j],
+                    'p_value': p_values[i, j]
+                }
+
         return {
             'correlation_matrix': correlation_matrix,
             'significant_genetic_behavioral_links': significant_correlations
@@ -156,23 +286,28 @@ class PredatoryBehaviorResearch:
         - Heatmaps
         - Correlation plots
         - Clustering visualizations
+        
+        Plotting runs in a separate process; the returned process can be
+        joined by callers that need the image on disk.
         """
         if self.research_data is None:
             print("No research data for visualization")
             return
         
-        # Correlation Heatmap
-        plt.figure(figsize=(12, 10))
-        sns.heatmap(
-            self.research_data.corr(), 
-            annot=True, 
-            cmap='coolwarm', 
-            linewidths=0.5
+        # Correlation Heatmap, rendered off the analysis thread
+        corr = self._correlation_matrix()
+        worker = multiprocessing.get_context('spawn').Process(
+            target=_plot_correlation_heatmap,
+            args=(corr.values, list(corr.columns), 'correlation_heatmap.png')
         )
-        plt.title("Research Variables Correlation Heatmap")
-        plt.tight_layout()
-        plt.savefig('correlation_heatmap.png')
-        plt.close()
+        worker.start()
+        return worker
+
+    def _correlation_matrix(self) -> pd.DataFrame:
+        """Full correlation matrix, computed once per loaded dataset"""
+        if self._corr is None:
+            self._corr = self.research_data.corr()
+        return self._corr
 
     def generate_comprehensive_report(self) -> Dict[str, Any]:
         """
@@ -1,17 +1,13 @@
 #!/usr/bin/env python3
 
-import os
 import sys
 import argparse
 import json
 import logging
 from typing import Dict, Any
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from src.core.email_processor import EmailProcessor
-from config.openrouter_access import OpenRouterAccessManager
+from revvel_email_organizer.core.email_processor import EmailProcessor
+from revvel_email_organizer.config.openrouter_access import OpenRouterAccessManager
 
 class EmailOrganizerCLI:
     def __init__(self):
@@ -6,12 +6,12 @@ import logging
 from typing import Dict, Any
 
 # Import custom modules
-from src.core.security_engine import SecurityEngine
-from src.core.email_processor import EmailProcessingEngine
-from src.core.ml_classifier import EmailClassificationSystem
-from src.core.database import DatabaseManager
-from src.api.routes import create_fastapi_app
-from src.core.config import load_config
+from revvel_email_organizer.core.security_engine import SecurityEngine
+from revvel_email_organizer.core.email_processor import EmailProcessingEngine
+from revvel_email_organizer.core.ml_classifier import EmailClassificationSystem
+from revvel_email_organizer.core.database import DatabaseManager
+from revvel_email_organizer.api.routes import create_fastapi_app
+from revvel_email_organizer.core.config import load_config
 
 class RevvelEmailOrganizerApp:
     def __init__(self, config_path: str):
@@ -1,10 +1,14 @@
+from pathlib import Path
 from setuptools import setup, find_packages
 
+README = Path(__file__).parent / 'README.md'
+LONG_DESCRIPTION = README.read_text(encoding='utf-8') if README.is_file() else ''
+
 setup(
     name='revvel-email-organizer',
     version='1.0.0',
     description='Intelligent, Privacy-First Email Organization Tool',
-    long_description=open('README.md').read(),
+    long_description=LONG_DESCRIPTION,
     long_description_content_type='text/markdown',
     author='Audrey Evans',
     author_email='audrey@revvel.com',
@@ -21,10 +25,11 @@ setup(
         'pandas',
         'numpy',
         'requests',
+        'orjson',
         'cryptography',
         'mailparser',
         'fastapi',
-        'uvicorn'
+        'uvicorn[standard]'
     ],
     extras_require={
         'dev': [
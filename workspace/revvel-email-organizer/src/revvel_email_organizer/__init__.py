@@ -0,0 +1 @@
+# Revvel Email Organizer Package
\ No newline at end of file
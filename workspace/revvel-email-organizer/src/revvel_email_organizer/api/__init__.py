@@ -0,0 +1 @@
+# Revvel Email Organizer API Module
\ No newline at end of file
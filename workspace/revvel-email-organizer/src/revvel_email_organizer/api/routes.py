@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import orjson
+import logging
+import logging.handlers
+import functools
+import threading
+from typing import Callable, Dict, List, Any, Optional
+
+import uvicorn
+from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import OAuth2PasswordBearer
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, Field
+
+# Largest email batch accepted by /classify/emails in one request
+MAX_CLASSIFICATION_BATCH = 10_000
+
+LOG_DIR = '/var/log/revvel_email_organizer/api'
+_logging_initialized = False
+
+def _init_logging():
+    """
+    Configure API logging once per process
+    
+    Uvicorn workers are separate processes appending to the same file, so
+    rotation is left to logrotate; WatchedFileHandler reopens the file
+    after it has been rotated away.
+    """
+    global _logging_initialized
+    if _logging_initialized:
+        return
+    
+    os.makedirs(LOG_DIR, exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.handlers.WatchedFileHandler(f'{LOG_DIR}/api.log'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+    _logging_initialized = True
+
+def _lazy_component(build: Callable) -> property:
+    """
+    Cache a component on first access, building it at most once
+    
+    functools.cached_property has no lock from Python 3.12 on, so two
+    concurrent first requests could each build the same component.
+    """
+    name = build.__name__
+    
+    @functools.wraps(build)
+    def getter(self):
+        value = self.__dict__.get(name)
+        if value is None:
+            with self._component_lock:
+                value = self.__dict__.get(name)
+                if value is None:
+                    value = self.__dict__[name] = build(self)
+        return value
+    
+    return property(getter)
+
+class ORJSONRequest(Request):
+    """
+    Request whose JSON body is decoded with orjson
+    """
+    async def json(self) -> Any:
+        if not hasattr(self, '_json'):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+class ORJSONRoute(APIRoute):
+    """
+    Route that hands handlers an ORJSONRequest, so request bodies are
+    parsed by orjson before Pydantic validation
+    """
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+        
+        async def orjson_route_handler(request: Request):
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+        
+        return orjson_route_handler
+
+class EmailProcessingRequest(BaseModel):
+    """
+    Request model for email processing
+    """
+    archive_path: str = Field(..., description="Path to email archive")
+    config: Optional[Dict[str, Any]] = Field(None, description="Processing configuration")
+
+class EmailClassificationRequest(BaseModel):
+    """
+    Request model for email classification
+    """
+    emails: List[Dict[str, str]] = Field(..., description="List of emails to classify")
+
+class TokenRequest(BaseModel):
+    """
+    Request model for token generation
+    """
+    app_name: str = Field(..., description="Name of the application")
+
+class RevvelEmailOrganizerAPI:
+    def __init__(self):
+        """
+        Initialize API with core components
+        """
+        # Guards first-time construction of the lazy components
+        self._component_lock = threading.RLock()
+        
+        # Load configurations
+        self.config = self._load_config()
+        
+        # Setup logging
+        self._setup_logging()
+        
+        # Core components are created lazily on first use (see properties
+        # below) so startup and reloads skip the sklearn/pandas import cost.
+        # Handlers resolve them inside the threadpool, so the first request
+        # pays that cost without blocking the event loop.
+        
+        # Create FastAPI app
+        self.app = self._create_fastapi_app()
+
+    @_lazy_component
+    def security_engine(self):
+        """Security engine, imported and created on first access"""
+        from ..core.security_engine import SecurityEngine
+        return SecurityEngine(self.config)
+
+    @_lazy_component
+    def openrouter_manager(self):
+        """OpenRouter access manager, imported and created on first access"""
+        from ..config.openrouter_access import OpenRouterAccessManager
+        return OpenRouterAccessManager()
+
+    @_lazy_component
+    def email_processor(self):
+        """Email processor, imported and created on first access"""
+        from ..core.email_processor import EmailProcessor
+        return EmailProcessor(self.config)
+
+    @_lazy_component
+    def ml_classifier(self):
+        """ML classifier, imported and created on first access"""
+        from ..core.ml_classifier import EmailClassificationSystem
+        return EmailClassificationSystem(self.config)
+
+    def _load_config(self) -> Dict[str, Any]:
+        """
+        Load API configuration
+        
+        Returns:
+            Dict with configuration
+        """
+        default_config = {
+            'api': {
+                'cors': {
+                    'allowed_origins': ['*'],
+                    'allowed_methods': ['*'],
+                    'allowed_headers': ['*']
+                }
+            },
+            'security': {
+                'jwt': {
+                    'secret_key': 'your-secret-key',
+                    'algorithm': 'HS256'
+                }
+            }
+        }
+        
+        # In a real-world scenario, load from a config file or environment
+        return default_config
+
+    def _setup_logging(self):
+        """
+        Configure API logging
+        """
+        _init_logging()
+        self.logger = logging.getLogger('RevvelEmailOrganizerAPI')
+
+    def _create_fastapi_app(self) -> FastAPI:
+        """
+        Create FastAPI application with middleware and routes
+        
+        Returns:
+            FastAPI application instance
+        """
+        app = FastAPI(
+            title="Revvel Email Organizer API",
+            description="Intelligent, privacy-preserving email processing API",
+            version="1.0.0",
+            default_response_class=ORJSONResponse
+        )
+        
+        # Decode request bodies with orjson (responses use ORJSONResponse)
+        app.router.route_class = ORJSONRoute
+        
+        # CORS Middleware
+        cors_config = self.config['api']['cors']
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=cors_config['allowed_origins'],
+            allow_credentials=True,
+            allow_methods=cors_config['allowed_methods'],
+            allow_headers=cors_config['allowed_headers']
+        )
+        
+        # Register routes
+        self._register_routes(app)
+        
+        return app
+
+    def _register_routes(self, app: FastAPI):
+        """
+        Register API routes
+        
+        Args:
+            app (FastAPI): FastAPI application instance
+        """
+        @app.post("/process/archive")
+        async def process_email_archive(request: EmailProcessingRequest):
+            """
+            Process email archive
+            """
+            try:
+                # Encrypt archive path
+                encrypted_path = await run_in_threadpool(
+                    lambda: self.security_engine.encrypt_email_data(
+                        {'archive_path': request.archive_path}
+                    )
+                )
+                
+                # Process emails
+                result = await run_in_threadpool(
+                    lambda: self.email_processor.process_archive(
+                        encrypted_path['archive_path'],
+                        request.config or {}
+                    )
+                )
+                
+                return result
+            
+            except ValueError as e:
+                # Unsupported archive formats are a client error
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                self.logger.error(f"Email archive processing error: {e}")
+                raise HTTPException(status_code=500, detail=str(e))
+
+        @app.post("/classify/emails")
+        async def classify_emails(request: EmailClassificationRequest):
+            """
+            Classify emails using machine learning
+            
+            The whole batch is handed to the classifier in one call so it
+            can vectorize and predict on all emails at once.
+            """
+            if len(request.emails) > MAX_CLASSIFICATION_BATCH:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"At most {MAX_CLASSIFICATION_BATCH} emails per request"
+                )
+            
+            try:
+                # Classify emails
+                result = await run_in_threadpool(
+                    lambda: self.ml_classifier.classify_emails(request.emails)
+                )
+                return result
+            
+            except Exception as e:
+                self.logger.error(f"Email classification error: {e}")
+                raise HTTPException(status_code=500, detail=str(e))
+
+        @app.post("/tokens/generate")
+        async def generate_app_token(request: TokenRequest):
+            """
+            Generate application-specific token
+            """
+            try:
+                # CSPRNG draw and token file write happen off the event loop
+                token = await run_in_threadpool(
+                    lambda: self.openrouter_manager.generate_app_specific_token(
+                        request.app_name
+                    )
+                )
+                return token
+            
+            except Exception as e:
+                self.logger.error(f"Token generation error: {e}")
+                raise HTTPException(status_code=500, detail=str(e))
+
+        @app.get("/models/list")
+        async def list_openrouter_models():
+            """
+            List available OpenRouter models
+            """
+            try:
+                models = await run_in_threadpool(
+                    lambda: self.openrouter_manager.call_openrouter_api('models')
+                )
+                return models
+            
+            except Exception as e:
+                self.logger.error(f"Model listing error: {e}")
+                raise HTTPException(status_code=500, detail=str(e))
+
+        @app.get("/health")
+        async def health_check():
+            """
+            API health check endpoint
+            """
+            return {
+                "status": "healthy",
+                "version": "1.0.0",
+                "components": {
+                    "email_processor": "running",
+                    "ml_classifier": "running",
+                    "security_engine": "running"
+                }
+            }
+
+def create_fastapi_app():
+    """
+    Create and return FastAPI application
+    
+    Returns:
+        FastAPI application instance
+    """
+    api = RevvelEmailOrganizerAPI()
+    return api.app
+
+def run_server(host: str = "0.0.0.0", port: int = 8000, workers: Optional[int] = None):
+    """
+    Run API server
+    
+    Args:
+        host (str): Server host
+        port (int): Server port
+        workers (int, optional): Worker processes; defaults to half the CPUs
+    """
+    if workers is None:
+        workers = max(1, (os.cpu_count() or 1) // 2)
+    
+    # loop/http "auto" select uvloop and httptools when installed
+    uvicorn.run(
+        "revvel_email_organizer.api.routes:create_fastapi_app", 
+        factory=True,
+        host=host, 
+        port=port, 
+        workers=workers,
+        reload=False,
+        loop="auto",
+        http="auto"
+    )
+
+def main():
+    # Run API server
+    run_server()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1 @@
+# Revvel Email Organizer Configuration Module
\ No newline at end of file
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import copy
+import time
+import secrets
+import threading
+import logging
+import tempfile
+import logging.handlers
+import functools
+from collections import OrderedDict
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+# Seconds a cached /models listing is served before re-fetching
+MODELS_CACHE_TTL = 60
+# Endpoints whose last ETag and body are kept for revalidation
+ETAG_CACHE_SIZE = 128
+
+LOG_DIR = '/var/log/revvel_email_organizer/openrouter'
+LOGGER_NAME = 'OpenRouterAccessManager'
+_logging_initialized = False
+
+def _init_logging():
+    """
+    Configure access-management logging once per process
+    
+    The access log handler is attached to this module's own logger, so it
+    is written even when the API has already configured the root logger.
+    Several API workers append to the same file; rotation is left to
+    logrotate and WatchedFileHandler reopens the file after it is rotated.
+    """
+    global _logging_initialized
+    if _logging_initialized:
+        return
+    
+    os.makedirs(LOG_DIR, exist_ok=True)
+    handler = logging.handlers.WatchedFileHandler(f'{LOG_DIR}/access.log')
+    handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    ))
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    
+    # Console output when run standalone; a no-op if the API configured logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+    _logging_initialized = True
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a JSON config file, memoized per (path, modification time)
+    
+    Args:
+        config_path (str): Path to config file
+        mtime_ns (int): File modification time, so edits invalidate the cache
+    
+    Returns:
+        Dict with parsed configuration (shared; do not mutate)
+    """
+    return orjson.loads(Path(config_path).read_bytes())
+
+class OpenRouterAccessManager:
+    def __init__(self, config_path: str = None):
+        """
+        Manage OpenRouter API access and token management
+        
+        Args:
+            config_path (str, optional): Path to configuration file
+        """
+        # Setup logging
+        self._setup_logging()
+        
+        # Load configuration
+        self.config = self._load_config(config_path)
+        
+        # Token storage directory is created once, not per token write
+        self._token_dir = self.config['token_management']['storage_path']
+        os.makedirs(self._token_dir, exist_ok=True)
+        self._rotation_delta = timedelta(days=self.config['token_management']['rotation_days'])
+        
+        # Initialize API access
+        self.api_key = self._get_api_key()
+        self._base_url = self.config['openrouter']['base_url']
+        self._base_headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json',
+            'HTTP-Referer': self.config['openrouter']['app_url'],
+            'X-Title': self.config['openrouter']['app_name']
+        }
+        self._session = self._create_session()
+        self._models_cache = {'at': 0.0, 'data': None}
+        self._etag_cache: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._etag_lock = threading.Lock()
+        
+    def _load_config(self, config_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Load configuration from file or environment
+        
+        Args:
+            config_path (str, optional): Path to config file
+        
+        Returns:
+            Dict with configuration
+        """
+        # Default configuration
+        default_config = {
+            'openrouter': {
+                'api_key_env': 'OPENROUTER_API_KEY',
+                'base_url': 'https://openrouter.ai/api/v1',
+                'app_name': 'Revvel Email Organizer',
+                'app_url': 'https://revvel.com'
+            },
+            'token_management': {
+                'rotation_days': 90,
+                'storage_path': '/etc/revvel/tokens'
+            }
+        }
+        
+        # Load from config file if provided
+        if config_path:
+            try:
+                mtime_ns = os.stat(config_path).st_mtime_ns
+                user_config = _load_config_cached(config_path, mtime_ns)
+                default_config.update(copy.deepcopy(user_config))
+            except FileNotFoundError:
+                pass
+            except (OSError, orjson.JSONDecodeError) as e:
+                self.logger.warning(f"Config load error: {e}")
+        
+        return default_config
+
+    def _setup_logging(self):
+        """Configure logging for access management"""
+        _init_logging()
+        self.logger = logging.getLogger(LOGGER_NAME)
+
+    def _get_api_key(self) -> str:
+        """
+        Retrieve OpenRouter API key
+        
+        Returns:
+            str: API key from environment or configuration
+        """
+        key_env = self.config['openrouter']['api_key_env']
+        api_key = os.environ.get(key_env)
+        
+        if not api_key:
+            self.logger.error(f"API key not found in environment: {key_env}")
+            raise ValueError(f"OpenRouter API key must be set in {key_env}")
+        
+        return api_key
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a pooled HTTP session for OpenRouter calls
+        
+        Keep-alive connections are reused across calls, and the static
+        headers are set once on the session.
+        
+        Returns:
+            requests.Session: Configured session
+        """
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 502, 503, 504]
+            )
+        ))
+        session.headers.update(self._base_headers)
+        return session
+
+    def generate_app_specific_token(self, app_name: str) -> Dict[str, str]:
+        """
+        Generate a token specific to an application
+        
+        Args:
+            app_name (str): Name of the application
+        
+        Returns:
+            Dict with token details
+        """
+        try:
+            # Generate unique token
+            now = datetime.now(timezone.utc)
+            token_details = {
+                'app_name': app_name,
+                'token': self._create_unique_token(),
+                'created_at': now.isoformat(),
+                'expires_at': (now + self._rotation_delta).isoformat()
+            }
+            
+            # Store token securely
+            self._store_token(token_details)
+            
+            return token_details
+        
+        except Exception as e:
+            self.logger.error(f"Token generation error: {e}")
+            raise
+
+    def _create_unique_token(self) -> str:
+        """
+        Create a cryptographically secure unique token
+        
+        Returns:
+            str: Unique token
+        """
+        return secrets.token_hex(32)  # 256-bit token
+
+    def _store_token(self, token_details: Dict[str, str]):
+        """
+        Securely store application-specific token
+        
+        The serialized token is written with a single write to a private
+        (0o600) temp file unique to this call, fsynced, and renamed over the
+        target so readers never see a partial file and concurrent writers
+        never share a temp file.
+        
+        Args:
+            token_details (Dict): Token information to store
+        """
+        token_file = os.path.join(self._token_dir, f"{token_details['app_name']}_token.json")
+        data = orjson.dumps(token_details, option=orjson.OPT_INDENT_2)
+        
+        fd, tmp_file = tempfile.mkstemp(
+            dir=self._token_dir,
+            prefix=f".{token_details['app_name']}_token.",
+            suffix='.tmp'
+        )
+        try:
+            try:
+                os.write(fd, data)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, token_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_file)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def call_openrouter_api(self, endpoint: str, method: str = 'GET', data: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Make a generic call to OpenRouter API
+        
+        Args:
+            endpoint (str): API endpoint
+            method (str): HTTP method, upper-case (e.g. 'GET', 'POST')
+            data (Dict, optional): Request payload
+        
+        Returns:
+            Dict with API response
+        """
+        is_get = method == 'GET'
+        cache_models = is_get and endpoint == 'models'
+        if cache_models and self._models_cache['data'] is not None \
+                and time.monotonic() - self._models_cache['at'] < MODELS_CACHE_TTL:
+            return self._models_cache['data']
+        
+        try:
+            full_url = f"{self._base_url}/{endpoint}"
+            
+            # Revalidate GETs against the last ETag seen for this endpoint
+            headers = None
+            cached = self._etag_cache.get(endpoint) if is_get else None
+            if cached is not None:
+                headers = {'If-None-Match': cached[0]}
+            
+            # Session.request normalizes the verb itself
+            response = self._session.request(
+                method,
+                full_url, 
+                headers=headers,
+                data=orjson.dumps(data) if data is not None else None,
+                timeout=(3.05, 30)
+            )
+            
+            if response.status_code == 304 and cached is not None:
+                result = cached[1]
+            else:
+                response.raise_for_status()
+                result = orjson.loads(response.content)
+                
+                etag = response.headers.get('ETag')
+                if is_get and etag:
+                    with self._etag_lock:
+                        self._etag_cache[endpoint] = (etag, result)
+                        self._etag_cache.move_to_end(endpoint)
+                        if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                            self._etag_cache.popitem(last=False)
+            
+            if cache_models:
+                self._models_cache = {'at': time.monotonic(), 'data': result}
+            
+            return result
+        
+        except requests.RequestException as e:
+            self.logger.error(f"OpenRouter API call error: {e}")
+            raise
+
+def main():
+    # Example usage
+    access_manager = OpenRouterAccessManager()
+    
+    # Generate app-specific token
+    email_organizer_token = access_manager.generate_app_specific_token('email_organizer')
+    print(orjson.dumps(email_organizer_token, option=orjson.OPT_INDENT_2).decode())
+    
+    # Example API call
+    try:
+        models = access_manager.call_openrouter_api('models')
+        print(orjson.dumps(models, option=orjson.OPT_INDENT_2).decode())
+    except Exception as e:
+        print(f"API call failed: {e}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
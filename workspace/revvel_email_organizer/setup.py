@@ -1,5 +1,9 @@
+from pathlib import Path
 from setuptools import setup, find_packages
 
+README = Path(__file__).parent / 'README.md'
+LONG_DESCRIPTION = README.read_text(encoding='utf-8') if README.is_file() else ''
+
 setup(
     name='revvel-email-organizer',
     version='0.1.0',
@@ -8,7 +12,8 @@ setup(
     install_requires=[
         'click',
         'cryptography',
-        'openrouter-python'
+        'openrouter-python',
+        'orjson'
     ],
     entry_points={
         'console_scripts': [
@@ -18,7 +23,7 @@ setup(
     author='Audrey Evans',
     author_email='angelreporters@gmail.com',
     description='Intelligent Email Organization Tool',
-    long_description=open('README.md').read() if open('README.md').read() else '',
+    long_description=LONG_DESCRIPTION,
     long_description_content_type='text/markdown',
     url='https://github.com/midnghtsapphire/revvel-email-organizer',
     classifiers=[
@@ -2,16 +2,46 @@
 
 import os
 import sys
-import json
+import atexit
+import orjson
 import logging
-import threading
+import asyncio
+import math
 import time
+import queue
+import threading
+import collections
 import psutil
 import traceback
 from typing import Dict, List, Any, Optional
-import numpy as np
-from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler
+
+from fs_utils import ensure_dir
+
+# Critical thresholds packed one byte per metric (cpu, memory, disk). Lanes
+# hold threshold + 1 so that "value > threshold" becomes a test of each
+# lane's high bit after a single subtraction.
+_LANE_HIGH_BITS = 0x808080
+_PACKED_THRESHOLDS = (90 + 1) | (85 + 1) << 8 | (90 + 1) << 16
+_ANOMALY_LANES = (
+    (7, 'performance_degradation'),
+    (15, 'memory_leak'),
+    (23, 'resource_exhaustion')
+)
+
+# Performance ticks (one per minute) between Isolation Forest trend checks
+ANOMALY_BATCH_INTERVAL = 15
+
+# Health events written to disk per os.write call at most
+HEALTH_WRITE_BATCH = 64
+# Queued after the last event to stop the health log writer
+_WRITER_STOP = object()
+
+# Seconds a disk usage sample is reused; the percentage barely moves
+DISK_USAGE_TTL = 30
+
+def _pack_lane(value: float) -> int:
+    """Round a percentage up into a 7-bit lane (> threshold ⇔ ceil >= threshold + 1)"""
+    return min(max(math.ceil(value), 0), 127)
 
 class SelfHealingSystem:
     def __init__(self, application_config: Dict[str, Any]):
@@ -29,7 +59,9 @@ class SelfHealingSystem:
         
         # Initialize healing components
         self.health_tracker = ApplicationHealthTracker(self.application_name)
-        self.performance_monitor = PerformanceMonitor()
+        self.performance_monitor = PerformanceMonitor(
+            anomaly_detection=self.config.get('anomaly_detection', {}).get('enabled', False)
+        )
         self.security_guardian = SecurityGuardian()
         self.dependency_manager = DependencyManager()
         
@@ -44,7 +76,7 @@ class SelfHealingSystem:
     def _setup_logging(self):
         """Configure comprehensive logging system"""
         log_dir = f"/var/log/self_healing/{self.application_name}"
-        os.makedirs(log_dir, exist_ok=True)
+        ensure_dir(log_dir)
         
         logging.basicConfig(
             level=logging.INFO,
@@ -56,39 +88,25 @@ class SelfHealingSystem:
         )
         self.logger = logging.getLogger(f'SelfHealing_{self.application_name}')
 
-    def start_monitoring(self):
+    async def start_monitoring(self):
         """
         Start continuous monitoring and self-healing
         
-        Runs background threads for various monitoring tasks
+        Runs the monitoring tasks concurrently on one event loop
         """
-        # Performance monitoring thread
-        performance_thread = threading.Thread(
-            target=self._performance_monitoring_loop, 
-            daemon=True
+        await asyncio.gather(
+            self._performance_monitoring_loop(),
+            self._security_monitoring_loop(),
+            self._dependency_monitoring_loop()
         )
-        performance_thread.start()
-        
-        # Security monitoring thread
-        security_thread = threading.Thread(
-            target=self._security_monitoring_loop, 
-            daemon=True
-        )
-        security_thread.start()
-        
-        # Dependency health thread
-        dependency_thread = threading.Thread(
-            target=self._dependency_monitoring_loop, 
-            daemon=True
-        )
-        dependency_thread.start()
 
-    def _performance_monitoring_loop(self):
+    async def _performance_monitoring_loop(self):
         """
         Continuous performance monitoring and healing
         
         Detects and responds to performance issues
         """
+        tick = 0
         while True:
             try:
                 # Collect performance metrics
@@ -103,13 +121,25 @@ class SelfHealingSystem:
                     if healing_strategy:
                         healing_strategy(metrics)
                 
-                time.sleep(60)  # Check every minute
+                # Periodic trend check on the rolling window, off the loop
+                tick += 1
+                if self.performance_monitor.anomaly_detection and tick % ANOMALY_BATCH_INTERVAL == 0:
+                    outliers = await asyncio.to_thread(
+                        self.performance_monitor.detect_anomalies_batch,
+                        recent=ANOMALY_BATCH_INTERVAL
+                    )
+                    if outliers:
+                        self.logger.warning(
+                            f"Metric trend anomalies in {len(outliers)} recent samples"
+                        )
+                
+                await asyncio.sleep(60)  # Check every minute
             
             except Exception as e:
                 self.logger.error(f"Performance monitoring error: {e}")
-                time.sleep(30)  # Wait before retry
+                await asyncio.sleep(30)  # Wait before retry
 
-    def _security_monitoring_loop(self):
+    async def _security_monitoring_loop(self):
         """
         Continuous security monitoring and hardening
         """
@@ -121,13 +151,13 @@ class SelfHealingSystem:
                 # Auto-patch if possible
                 self.security_guardian.auto_patch(vulnerabilities)
                 
-                time.sleep(300)  # Check every 5 minutes
+                await asyncio.sleep(300)  # Check every 5 minutes
             
             except Exception as e:
                 self.logger.error(f"Security monitoring error: {e}")
-                time.sleep(60)  # Wait before retry
+                await asyncio.sleep(60)  # Wait before retry
 
-    def _dependency_monitoring_loop(self):
+    async def _dependency_monitoring_loop(self):
         """
         Continuous dependency health monitoring
         """
@@ -140,11 +170,15 @@ class SelfHealingSystem:
                 for dependency in unhealthy_dependencies:
                     self.dependency_manager.recover_dependency(dependency)
                 
-                time.sleep(180)  # Check every 3 minutes
+                await asyncio.sleep(180)  # Check every 3 minutes
             
             except Exception as e:
                 self.logger.error(f"Dependency monitoring error: {e}")
-                time.sleep(90)  # Wait before retry
+                await asyncio.sleep(90)  # Wait before retry
+
+    def close(self):
+        """Flush pending health events and release their log file"""
+        self.health_tracker.close()
 
     def _heal_performance(self, metrics: Dict[str, Any]):
         """
@@ -204,68 +238,201 @@ class ApplicationHealthTracker:
         """Track overall application health"""
         self.application_name = application_name
         self.health_log_path = f"/var/log/app_health/{application_name}_health.json"
+        
+        # Events are serialized by callers and written by one background thread
+        self._event_queue = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._write_health_events,
+            name=f'HealthWriter_{application_name}',
+            daemon=True
+        )
+        self._writer.start()
+        self._closed = False
+        
+        # Queued events are still written if the interpreter exits
+        atexit.register(self.close)
+
+    def close(self):
+        """Write any queued events, stop the writer thread and close the log"""
+        if self._closed:
+            return
+        self._closed = True
+        self._event_queue.put(_WRITER_STOP)
+        self._writer.join()
+        atexit.unregister(self.close)
 
     def record_health_event(self, event_type: str, details: Dict[str, Any]):
-        """Log health-related events"""
+        """Queue a health-related event for logging; returns immediately"""
         event = {
             "timestamp": time.time(),
             "type": event_type,
             "details": details
         }
+        self._event_queue.put(orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE))
+
+    def _write_health_events(self):
+        """
+        Drain the event queue into the health log
         
+        Up to HEALTH_WRITE_BATCH queued events are appended with a single
+        write and fsynced together.
+        """
+        fd = None
+        stopping = False
         try:
-            with open(self.health_log_path, 'a') as f:
-                json.dump(event, f)
-                f.write('\n')
-        except IOError as e:
-            logging.error(f"Could not log health event: {e}")
+            while not stopping:
+                batch = []
+                item = self._event_queue.get()
+                while True:
+                    if item is _WRITER_STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= HEALTH_WRITE_BATCH:
+                        break
+                    try:
+                        item = self._event_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                
+                if not batch:
+                    continue
+                try:
+                    if fd is None:
+                        fd = os.open(
+                            self.health_log_path,
+                            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                            0o644
+                        )
+                    os.write(fd, b''.join(batch))
+                    os.fsync(fd)
+                except OSError as e:
+                    logging.error(f"Could not log health events: {e}")
+        finally:
+            if fd is not None:
+                os.close(fd)
 
 class PerformanceMonitor:
+    def __init__(self, anomaly_detection: bool = False, window_size: int = 1440,
+                 min_fit_samples: int = 10):
+        """
+        Track performance metrics over a rolling window
+        
+        Args:
+            anomaly_detection (bool): Keep a metric window for periodic
+                Isolation Forest trend checks; numpy/sklearn are only
+                imported when enabled
+            window_size (int): Metric rows kept for model fitting (24h at 1/min)
+            min_fit_samples (int): Rows required before a batch check runs
+        """
+        self.anomaly_detection = anomaly_detection
+        self._metric_buffer = collections.deque(maxlen=window_size)
+        self._min_fit_samples = min_fit_samples
+        self._np = None
+        self._iforest = None
+        
+        # Prime the CPU counters so later non-blocking reads are meaningful
+        psutil.cpu_percent(interval=None)
+        self._last_net_bytes = self._net_bytes()
+        self._disk_usage = None
+        self._disk_usage_at = 0.0
+
     def collect_metrics(self) -> Dict[str, float]:
         """
         Collect system and application performance metrics
         
-        Returns comprehensive performance snapshot
+        Returns comprehensive performance snapshot. CPU usage is measured
+        since the previous call without blocking; disk usage is resampled
+        at most every DISK_USAGE_TTL seconds.
         """
         return {
-            'cpu_usage': psutil.cpu_percent(),
+            'cpu_usage': psutil.cpu_percent(interval=None),
             'memory_usage': psutil.virtual_memory().percent,
-            'disk_usage': psutil.disk_usage('/').percent,
+            'disk_usage': self._get_disk_usage(),
             'network_io': self._get_network_io()
         }
 
+    def _get_disk_usage(self) -> float:
+        """Get root filesystem usage, cached for DISK_USAGE_TTL seconds"""
+        now = time.monotonic()
+        if self._disk_usage is None or now - self._disk_usage_at >= DISK_USAGE_TTL:
+            self._disk_usage = psutil.disk_usage('/').percent
+            self._disk_usage_at = now
+        return self._disk_usage
+
     def _get_network_io(self) -> float:
-        """Get network I/O metrics"""
+        """Get network I/O since the previous collection, in MB"""
+        net_bytes = self._net_bytes()
+        delta = max(net_bytes - self._last_net_bytes, 0)  # counters reset on wrap
+        self._last_net_bytes = net_bytes
+        return delta / 1024 / 1024  # MB
+
+    @staticmethod
+    def _net_bytes() -> int:
+        """Total bytes sent and received since boot"""
         net_io = psutil.net_io_counters()
-        return (net_io.bytes_sent + net_io.bytes_recv) / 1024 / 1024  # MB
+        return net_io.bytes_sent + net_io.bytes_recv
 
     def detect_anomalies(self, metrics: Dict[str, float]) -> List[str]:
         """
-        Detect performance anomalies using machine learning
+        Detect performance anomalies from critical thresholds
         
-        Uses Isolation Forest for unsupervised anomaly detection
+        Runs every tick, so it stays a pure integer comparison; the sample
+        is also added to the window used by detect_anomalies_batch.
         """
-        anomalies = []
+        if self.anomaly_detection:
+            self._metric_buffer.append(tuple(metrics.values()))
+        return self._threshold_anomalies(metrics)
+
+    def detect_anomalies_batch(self, window=None, recent: Optional[int] = None) -> List[int]:
+        """
+        Detect long-term metric trend anomalies using machine learning
+        
+        Fits an Isolation Forest on a window of metric rows (by default the
+        rolling window) and scores the rows. Meant to run every few
+        minutes, not per tick.
         
-        # Prepare metrics for anomaly detection
-        metric_values = np.array(list(metrics.values())).reshape(-1, 1)
-        scaler = StandardScaler()
-        scaled_metrics = scaler.fit_transform(metric_values)
+        Args:
+            window (np.ndarray, optional): Metric rows, one column per metric
+            recent (int, optional): Only report outliers among the last
+                ``recent`` rows; older rows serve as the baseline
         
-        # Isolation Forest for anomaly detection
-        clf = IsolationForest(contamination=0.1, random_state=42)
-        predictions = clf.fit_predict(scaled_metrics)
+        Returns:
+            Indices of the rows flagged as anomalous
+        """
+        if self._np is None:
+            import numpy as np
+            from sklearn.ensemble import IsolationForest
+            self._np = np
+            # 'auto' uses the score cut-off from the original paper instead of
+            # always flagging a fixed share of the window
+            self._iforest = IsolationForest(contamination='auto', n_estimators=50, random_state=42)
+        np = self._np
         
-        # Identify anomaly types
-        if -1 in predictions:
-            if metrics['cpu_usage'] > 90:
-                anomalies.append('performance_degradation')
-            if metrics['memory_usage'] > 85:
-                anomalies.append('memory_leak')
-            if metrics['disk_usage'] > 90:
-                anomalies.append('resource_exhaustion')
+        if window is None:
+            window = np.array(self._metric_buffer, dtype=np.float32)
+        if len(window) < self._min_fit_samples:
+            return []
         
-        return anomalies
+        predictions = self._iforest.fit_predict(window)
+        start = 0 if recent is None else max(len(window) - recent, 0)
+        return (np.flatnonzero(predictions[start:] == -1) + start).tolist()
+
+    @staticmethod
+    def _threshold_anomalies(metrics: Dict[str, float]) -> List[str]:
+        """
+        Map critical threshold exceedances to anomaly types
+        
+        All three metrics are compared in one packed integer subtraction;
+        a lane keeps its high bit only if its value exceeds its threshold.
+        """
+        packed = (
+            _pack_lane(metrics['cpu_usage'])
+            | _pack_lane(metrics['memory_usage']) << 8
+            | _pack_lane(metrics['disk_usage']) << 16
+        )
+        mask = ((packed | _LANE_HIGH_BITS) - _PACKED_THRESHOLDS) & _LANE_HIGH_BITS
+        return [name for bit, name in _ANOMALY_LANES if mask >> bit & 1]
 
 class SecurityGuardian:
     def scan_vulnerabilities(self) -> List[Dict[str, Any]]:
@@ -306,21 +473,20 @@ def main():
     app_config = {
         'name': 'example_application',
         'version': '1.0.0',
-        'critical_dependencies': ['database', 'cache_service']
+        'critical_dependencies': ['database', 'cache_service'],
+        'anomaly_detection': {'enabled': True}
     }
     
     # Initialize self-healing system
     healing_system = SelfHealingSystem(app_config)
     
-    # Start monitoring
-    healing_system.start_monitoring()
-    
-    # Keep main thread running
+    # Run monitoring until interrupted
     try:
-        while True:
-            time.sleep(60)
+        asyncio.run(healing_system.start_monitoring())
     except KeyboardInterrupt:
         print("Self-healing system shutting down...")
+    finally:
+        healing_system.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,12 +1,65 @@
 #!/usr/bin/env python3
 
 import os
-import json
+import atexit
+import orjson
 import logging
 from datetime import datetime
 from typing import Dict, List, Any
 
+from fs_utils import ensure_dir
+
+# Userland buffer for the append-only reflection logs
+LOG_BUFFER_SIZE = 1 << 16
+
+_score_kernel = None
+
+def _get_score_kernel():
+    """
+    Build the bulk scoring kernel on first use
+    
+    Compiled with numba when it is installed; otherwise falls back to two
+    numpy matrix-vector products with the same result.
+    """
+    global _score_kernel
+    if _score_kernel is not None:
+        return _score_kernel
+    
+    import numpy as np
+    try:
+        from numba import njit, prange
+    except ImportError:
+        def _score(matrix, tox_w, emp_w):
+            return matrix @ tox_w, matrix @ emp_w
+    else:
+        @njit(parallel=True, fastmath=True, cache=True)
+        def _score(matrix, tox_w, emp_w):
+            n_rows, n_cols = matrix.shape
+            tox = np.empty(n_rows, dtype=np.float32)
+            emp = np.empty(n_rows, dtype=np.float32)
+            for i in prange(n_rows):
+                t = np.float32(0.0)
+                e = np.float32(0.0)
+                for j in range(n_cols):
+                    t += matrix[i, j] * tox_w[j]
+                    e += matrix[i, j] * emp_w[j]
+                tox[i] = t
+                emp[i] = e
+            return tox, emp
+    
+    _score_kernel = _score
+    return _score_kernel
+
 class StreetSmartsSkill:
+    # Interaction fields averaged into each score
+    _TOXIC_KEYS = ('aggressive_language', 'dismissive_tone', 'unnecessary_criticism')
+    _TOXIC_SCALE = 1.0 / len(_TOXIC_KEYS)
+    _EMPATHY_KEYS = ('active_listening', 'emotional_validation', 'supportive_language')
+    _EMPATHY_SCALE = 1.0 / len(_EMPATHY_KEYS)
+    _MISSING_DEFAULTS = (0, 0, 0)
+    # Column order of the matrix used for bulk scoring
+    _FEATURE_KEYS = _TOXIC_KEYS + _EMPATHY_KEYS
+
     def __init__(self, agent_id: str):
         self.agent_id = agent_id
         self.streets_dir = f"/home/agent/{agent_id}/.streets"
@@ -17,12 +70,36 @@ class StreetSmartsSkill:
             level=logging.INFO
         )
         self.logger = logging.getLogger('StreetSmarts')
+        
+        # Append-only JSONL logs kept open for the life of the skill
+        self._interaction_log_date = None
+        self._interaction_fh = None
+        self._intervention_fh = open(
+            f"{self.streets_dir}/reflection_logs/interventions.jsonl", 'ab', buffering=LOG_BUFFER_SIZE
+        )
+        self._metrics_fh = open(
+            f"{self.streets_dir}/performance_metrics/interaction_quality.jsonl", 'ab', buffering=LOG_BUFFER_SIZE
+        )
+        
+        # Buffered records are still written if the interpreter exits
+        atexit.register(self.close)
+
+    def close(self):
+        """Flush and close the open log files"""
+        for name in ('_interaction_fh', '_intervention_fh', '_metrics_fh'):
+            fh = getattr(self, name, None)
+            if fh is not None and not fh.closed:
+                fh.close()
+        atexit.unregister(self.close)
+
+    def __del__(self):
+        self.close()
 
     def _ensure_directory_structure(self):
         """Create necessary directory structure for skill"""
-        os.makedirs(f"{self.streets_dir}/reflection_logs", exist_ok=True)
-        os.makedirs(f"{self.streets_dir}/training_modules", exist_ok=True)
-        os.makedirs(f"{self.streets_dir}/performance_metrics", exist_ok=True)
+        ensure_dir(f"{self.streets_dir}/reflection_logs")
+        ensure_dir(f"{self.streets_dir}/training_modules")
+        ensure_dir(f"{self.streets_dir}/performance_metrics")
 
     def analyze_interaction(self, interaction_data: Dict[str, Any]):
         """Comprehensive interaction analysis"""
@@ -36,85 +113,94 @@ class StreetSmartsSkill:
         })
         
         if toxicity_score > 0.5 or empathy_score < 0.3:
-            self._trigger_intervention(interaction_data)
+            self._trigger_intervention(interaction_data, toxicity_score, empathy_score)
+            
+            # Interventions are rare and matter most; don't leave them buffered
+            self._interaction_fh.flush()
+            self._metrics_fh.flush()
+            self._intervention_fh.flush()
 
     def _log_interaction(self, interaction_data: Dict[str, Any]):
         """Log interaction details for later reflection"""
-        log_file = f"{self.streets_dir}/reflection_logs/{datetime.now().date()}_interactions.json"
-        with open(log_file, 'a') as f:
-            json.dump(interaction_data, f)
-            f.write('\n')
+        today = datetime.now().date()
+        if today != self._interaction_log_date:
+            # Interaction logs are per day; roll over to the new file
+            if self._interaction_fh is not None:
+                self._interaction_fh.close()
+            log_file = f"{self.streets_dir}/reflection_logs/{today}_interactions.jsonl"
+            self._interaction_fh = open(log_file, 'ab', buffering=LOG_BUFFER_SIZE)
+            self._interaction_log_date = today
+        
+        self._interaction_fh.write(orjson.dumps(interaction_data, option=orjson.OPT_APPEND_NEWLINE))
 
     def _calculate_toxicity(self, interaction_data: Dict[str, Any]) -> float:
         """Calculate toxicity score for an interaction"""
-        toxic_indicators = [
-            'aggressive_language',
-            'dismissive_tone',
-            'unnecessary_criticism'
-        ]
-        
-        toxicity_score = sum(
-            interaction_data.get(indicator, 0) 
-            for indicator in toxic_indicators
-        ) / len(toxic_indicators)
-        
-        return toxicity_score
+        return sum(map(
+            interaction_data.get, self._TOXIC_KEYS, self._MISSING_DEFAULTS
+        )) * self._TOXIC_SCALE
 
     def _assess_empathy(self, interaction_data: Dict[str, Any]) -> float:
         """Assess empathy in interaction"""
-        empathy_markers = [
-            'active_listening',
-            'emotional_validation',
-            'supportive_language'
-        ]
-        
-        empathy_score = sum(
-            interaction_data.get(marker, 0) 
-            for marker in empathy_markers
-        ) / len(empathy_markers)
-        
-        return empathy_score
+        return sum(map(
+            interaction_data.get, self._EMPATHY_KEYS, self._MISSING_DEFAULTS
+        )) * self._EMPATHY_SCALE
+
+    def analyze_interactions_bulk(self, interactions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Score many interactions at once (e.g. a replay of historical logs)
+        
+        Interactions are stacked into a float32 matrix with one column per
+        feature, and both scores are computed in a single compiled pass.
+        Nothing is logged and no interventions are triggered.
+        
+        Returns:
+            Dict with 'toxicity' and 'empathy' score arrays, one entry per
+            interaction
+        """
+        import numpy as np
+        
+        keys = self._FEATURE_KEYS
+        n_toxic = len(self._TOXIC_KEYS)
+        matrix = np.fromiter(
+            (interaction.get(key, 0) for interaction in interactions for key in keys),
+            dtype=np.float32,
+            count=len(interactions) * len(keys)
+        ).reshape(len(interactions), len(keys))
+        
+        tox_w = np.zeros(len(keys), dtype=np.float32)
+        tox_w[:n_toxic] = self._TOXIC_SCALE
+        emp_w = np.zeros(len(keys), dtype=np.float32)
+        emp_w[n_toxic:] = self._EMPATHY_SCALE
+        
+        toxicity, empathy = _get_score_kernel()(matrix, tox_w, emp_w)
+        return {'toxicity': toxicity, 'empathy': empathy}
 
     def _update_performance_metrics(self, metrics: Dict[str, float]):
-        """Update overall performance tracking"""
-        metrics_file = f"{self.streets_dir}/performance_metrics/interaction_quality.json"
-        
-        try:
-            with open(metrics_file, 'r') as f:
-                historical_metrics = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            historical_metrics = []
-        
-        historical_metrics.append({
+        """Update overall performance tracking (one JSONL record per update)"""
+        self._metrics_fh.write(orjson.dumps({
             'timestamp': datetime.now().isoformat(),
             **metrics
-        })
-        
-        with open(metrics_file, 'w') as f:
-            json.dump(historical_metrics, f, indent=2)
+        }, option=orjson.OPT_APPEND_NEWLINE))
 
-    def _trigger_intervention(self, interaction_data: Dict[str, Any]):
-        """Recommend skill interventions based on performance"""
+    def _trigger_intervention(self, interaction_data: Dict[str, Any], 
+                              toxicity_score: float, empathy_score: float):
+        """Recommend skill interventions based on already-computed scores"""
         intervention_recommendations = []
         
-        if self._calculate_toxicity(interaction_data) > 0.5:
+        if toxicity_score > 0.5:
             intervention_recommendations.append('communication_skills_training')
         
-        if self._assess_empathy(interaction_data) < 0.3:
+        if empathy_score < 0.3:
             intervention_recommendations.append('empathy_enhancement_module')
         
         self._log_intervention(intervention_recommendations)
 
     def _log_intervention(self, recommendations: List[str]):
         """Log intervention recommendations"""
-        intervention_log = f"{self.streets_dir}/reflection_logs/interventions.json"
-        
-        with open(intervention_log, 'a') as f:
-            json.dump({
-                'timestamp': datetime.now().isoformat(),
-                'recommendations': recommendations
-            }, f)
-            f.write('\n')
+        self._intervention_fh.write(orjson.dumps({
+            'timestamp': datetime.now().isoformat(),
+            'recommendations': recommendations
+        }, option=orjson.OPT_APPEND_NEWLINE))
 
     def run_self_improvement_drill(self):
         """Simulate and analyze challenging interaction scenarios"""
@@ -153,7 +239,9 @@ def main():
     agent_skill.analyze_interaction(interaction_example)
     drill_results = agent_skill.run_self_improvement_drill()
     
-    print(json.dumps(drill_results, indent=2))
+    agent_skill.close()
+    
+    print(orjson.dumps(drill_results, option=orjson.OPT_INDENT_2).decode())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file